@@ -26,11 +26,33 @@ This script processes master images and generates all required sizes for:
 - Native Android app icons and splash screens
 
 Usage:
-    python3 gipity-image-resizer.py
+    python3 gipity-image-resizer.py [--force] [--backend {pillow,opencv}] [--dry-run]
+
+    Images that are already newer than their master and at the right size are
+    skipped, as are images of masters unchanged since the last successful run
+    (recorded in master-images/.gipity-assets-manifest.json). If no master has
+    changed and every output still exists, only the config files are refreshed.
+    Pass --force to regenerate every image.
+
+    --backend opencv resizes with OpenCV instead of Pillow (faster for large
+    icon sets; requires opencv-python-headless).
+
+    Generated JSON config files are compact; set GIPITY_PRETTY_JSON=1 to write
+    them indented instead.
+
+    --dry-run lists every unique rendition and the outputs it is written to,
+    without creating any files.
 
 Requirements:
     pip install Pillow
 
+    Optional (x86_64 only): Pillow-SIMD is a drop-in replacement for Pillow with
+    SSE4/AVX2 accelerated resampling, typically 2-6x faster for LANCZOS resizes:
+    pip uninstall pillow && pip install pillow-simd
+
+    Optional: OpenCV for the --backend opencv resizer:
+    pip install opencv-python-headless
+
 Master Image Requirements (in master-images/ folder):
 
 1. icon-master.png: 1024x1024px PNG
@@ -70,11 +92,28 @@ Master Image Requirements (in master-images/ folder):
 """
 
 import os
+import io
 import sys
+import argparse
 import shutil
+import filecmp
 import json
+import math
+import functools
+import platform
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+import PIL
 from PIL import Image, ImageOps
 
+try:
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = None
+
 #==============================================================================
 # CONFIGURATION
 #==============================================================================
@@ -83,108 +122,692 @@ from PIL import Image, ImageOps
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 
+# Large downscales first shrink by an integer factor with Image.reduce() (a fast
+# box filter), leaving at least this ratio for the final LANCZOS pass
+REDUCING_GAP = 2.0
+
+# Available resize implementations (opencv requires opencv-python-headless)
+RESIZE_BACKENDS = ("pillow", "opencv")
+
+# Android resource folder and the density buckets its generated assets cover
+ANDROID_RES_DIR = "android/app/src/main/res"
+ANDROID_DENSITIES = ("ldpi", "mdpi", "hdpi", "xhdpi", "xxhdpi", "xxxhdpi")
+
+# Android launcher icon edge length (px) per density bucket
+ANDROID_ICON_SIZES = (
+    ("ldpi", 36),     # Low density
+    ("mdpi", 48),     # Medium density
+    ("hdpi", 72),     # High density
+    ("xhdpi", 96),    # Extra high density
+    ("xxhdpi", 144),  # Extra extra high density
+    ("xxxhdpi", 192), # Extra extra extra high density
+)
+
+# Config JSON is written compact; set GIPITY_PRETTY_JSON=1 for indented output
+# (empty, "0", "false" and "no" leave it compact)
+PRETTY_JSON = os.environ.get("GIPITY_PRETTY_JSON", "").strip().lower() not in ("", "0", "false", "no")
+
+# Pre-rendered iOS Contents.json files, copied into the asset catalogs as-is
+TEMPLATE_DIR = os.path.join(SCRIPT_DIR, "templates")
+IOS_CONTENTS_TEMPLATES = (
+    ("ios-appicon-contents.template.json", "ios/App/App/Assets.xcassets/AppIcon.appiconset/Contents.json"),
+    ("ios-splash-contents.template.json", "ios/App/App/Assets.xcassets/Splash.imageset/Contents.json"),
+)
+
+# Sizes and mtimes of the master images (and this script) at the last successful
+# run, plus every file it produced; outputs of masters that still match are not
+# re-checked or regenerated, and if nothing changed the run exits straight away
+ASSET_MANIFEST_PATH = "master-images/.gipity-assets-manifest.json"
+ASSET_MANIFEST_VERSION = 2
+
+# Every directory the generators write into (relative to project root), created
+# once at startup instead of checking before each file
+ALL_OUTPUT_DIRS = (
+    "public/icons",
+    "public/splash",
+    "client/src/assets",
+    "ios/App/App/Assets.xcassets/AppIcon.appiconset",
+    "ios/App/App/Assets.xcassets/Logo.imageset",
+    "ios/App/App/Assets.xcassets/LogoInverted.imageset",
+    "ios/App/App/Assets.xcassets/Splash.imageset",
+    f"{ANDROID_RES_DIR}/drawable",
+    f"{ANDROID_RES_DIR}/mipmap-anydpi-v26",
+) + tuple(
+    f"{ANDROID_RES_DIR}/{folder}-{density}"
+    for folder in ("mipmap", "drawable", "drawable-port", "drawable-land")
+    for density in ANDROID_DENSITIES
+)
+
 #==============================================================================
-# UTILITY FUNCTIONS
+# RESIZE JOBS
 #==============================================================================
 
-def ensure_directory(path):
-    """Create directory if it doesn't exist"""
-    os.makedirs(path, exist_ok=True)
+@dataclass(frozen=True)
+class Job:
+    """One output image: the master it comes from, its size, path and fit options"""
+    master: str
+    size: tuple
+    out: str
+    maintain_aspect: bool = True
+    margin: bool = False  # Apply 70% safe margin for Android adaptive icons
+    
+    @property
+    def render_key(self):
+        """Outputs sharing this key are byte-identical and rendered only once"""
+        return (self.master, self.size, self.maintain_aspect, self.margin)
+
+def group_by(items, key):
+    """Group items into a dict of lists by key, keeping first-seen order"""
+    groups = {}
+    for item in items:
+        groups.setdefault(key(item), []).append(item)
+    return groups
 
+#==============================================================================
+# UTILITY FUNCTIONS
+#==============================================================================
+
+@functools.lru_cache(maxsize=None)
 def get_project_path(relative_path):
-    """Get absolute path relative to project root"""
+    """Get absolute path relative to project root (memoized - paths are joined once)"""
     return os.path.join(PROJECT_ROOT, relative_path)
 
-def resize_image(source_path, output_path, size, maintain_aspect=True, adaptive_icon_safe_margin=False):
+def scan_directory(path):
+    """Map the names of the files in a directory to their os.DirEntry in one pass (empty if missing)"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return {}
+
+def create_output_directories():
+    """Create every output directory in ALL_OUTPUT_DIRS in a single pass"""
+    for relative_dir in ALL_OUTPUT_DIRS:
+        os.makedirs(get_project_path(relative_dir), exist_ok=True)
+
+def print_banner(title):
+    """Print a section banner with a single write"""
+    sys.stdout.write(f"\n{'=' * 50}\n{title}\n{'=' * 50}\n")
+
+def check_pillow_build():
+    """Report the Pillow build and suggest Pillow-SIMD on x86_64 machines"""
+    # Pillow-SIMD releases carry a .postN version suffix
+    if ".post" in PIL.__version__:
+        print(f"Pillow: {PIL.__version__} (SIMD build)")
+        return
+    
+    print(f"Pillow: {PIL.__version__}")
+    if platform.machine() in ('x86_64', 'AMD64'):
+        print("   Tip: install Pillow-SIMD for 2-6x faster resizing on this CPU:")
+        print("   pip uninstall pillow && pip install pillow-simd")
+
+@functools.lru_cache(maxsize=None)
+def get_master_size(source_path):
+    """Read master image dimensions from the file header without decoding pixels"""
+    with Image.open(source_path) as source_img:
+        return source_img.size
+
+@functools.lru_cache(maxsize=None)
+def load_master(source_path):
+    """Decode a master image once and keep it in memory as RGBA, or RGB if fully opaque"""
+    with Image.open(source_path) as source_img:
+        source_img.load()
+        # Opaque masters (e.g. solid splash backgrounds) stay RGB to save a quarter
+        # of the memory and resampling work
+        if source_img.mode == 'RGBA' or (source_img.mode == 'RGB' and 'transparency' not in source_img.info):
+            return source_img
+        return source_img.convert('RGBA')
+
+def get_fit_box(size, adaptive_icon_safe_margin=False):
+    """Get the bounding box an aspect-preserving resize must fit inside"""
+    if adaptive_icon_safe_margin:
+        # Apply safe margin for Android adaptive icons (70% of canvas)
+        return (int(size[0] * 0.7), int(size[1] * 0.7))
+    return size
+
+def get_fit_size(image_size, box):
+    """Get the largest size within box that keeps the image aspect ratio (never upscales)"""
+    width, height = image_size
+    x, y = box
+    if x >= width and y >= height:
+        return image_size
+    
+    # Same rounding as Image.thumbnail so results match pixel for pixel
+    aspect = width / height
+    if x / y >= aspect:
+        candidates = (math.floor(y * aspect), math.ceil(y * aspect))
+        x = max(min(candidates, key=lambda n: abs(aspect - n / y)), 1)
+    else:
+        candidates = (math.floor(x / aspect), math.ceil(x / aspect))
+        y = max(min(candidates, key=lambda n: 0 if n == 0 else abs(aspect - x / n)), 1)
+    return (x, y)
+
+def get_downscale_source(source_path, box, downscale_chain):
+    """
+    Pick the image to downsample from for an aspect-preserving resize
+    
+    Returns the smallest earlier result in the chain that is still at least twice
+    the target box, so each resample step stays a genuine 2x+ reduction and keeps
+    the same quality as resampling from the master. Falls back to the master.
+    """
+    source_img = load_master(source_path)
+    for candidate in downscale_chain or ():
+        if min(box[0] / candidate.width, box[1] / candidate.height) <= 0.5:
+            source_img = candidate
+    return source_img
+
+def center_on_canvas(img, size):
     """
-    Resize image to specified size with quality preservation
+    Center an image on a transparent RGBA canvas of the given size
+    
+    Cropping beyond the image bounds allocates the canvas, zero-fills the margins
+    and copies the image rows in a single C call, without the clear-then-paste
+    passes of Image.new() + paste().
+    """
+    if img.mode != 'RGBA':
+        img = img.convert('RGBA')
+    x = (size[0] - img.width) // 2
+    y = (size[1] - img.height) // 2
+    return img.crop((-x, -y, size[0] - x, size[1] - y))
+
+def resize_to_fit(source_path, box, downscale_chain=None):
+    """
+    Resize a master image with Pillow to fit a box, keeping its aspect ratio
+    
+    Downsamples from the nearest suitable earlier result in downscale_chain (see
+    get_downscale_source) and appends the result to it. resize returns a new image,
+    so the cached master and chain entries never need copying.
+    """
+    source_img = get_downscale_source(source_path, box, downscale_chain)
+    img = source_img.resize(get_fit_size(source_img.size, box), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+    if downscale_chain is not None:
+        downscale_chain.append(img)
+    return img
+
+def render_png(source_path, size, maintain_aspect=True, adaptive_icon_safe_margin=False, downscale_chain=None):
+    """
+    Resize a master image with Pillow and return the encoded PNG bytes
     
     Args:
         source_path: Path to source image
-        output_path: Path for output image
         size: Target size tuple (width, height)
         maintain_aspect: Whether to maintain aspect ratio
         adaptive_icon_safe_margin: Apply 70% safe margin for Android adaptive icons
+        downscale_chain: Optional list of earlier aspect-preserving results from the
+                         same master, largest first; used as downsampling sources and
+                         extended with this result
+    
+    Returns:
+        bytes: Encoded PNG image
+    """
+    if maintain_aspect:
+        img = resize_to_fit(source_path, get_fit_box(size, adaptive_icon_safe_margin), downscale_chain)
+        
+        # Images that already fill the canvas exactly need no transparent padding
+        if img.size != size:
+            img = center_on_canvas(img, size)
+    else:
+        # Stretch to exact size
+        img = load_master(source_path).resize(size, Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+    
+    # Encode as PNG with transparency; fast zlib level since encode dominates small icons
+    buffer = io.BytesIO()
+    img.save(buffer, 'PNG', optimize=False, compress_level=1)
+    return buffer.getvalue()
+
+def premultiply_alpha(img):
+    """Scale BGRA colour channels by alpha so resampling can't bleed colour out of transparent pixels"""
+    alpha = img[:, :, 3]
+    colour = cv2.multiply(img[:, :, :3], cv2.merge((alpha, alpha, alpha)), scale=1 / 255)
+    return cv2.merge((colour, alpha))
+
+def unpremultiply_alpha(img):
+    """Undo premultiply_alpha on a resampled BGRA image (fully transparent pixels become black)"""
+    alpha = img[:, :, 3]
+    colour = cv2.divide(img[:, :, :3], cv2.merge((alpha, alpha, alpha)), scale=255)
+    return cv2.merge((colour, alpha))
+
+@functools.lru_cache(maxsize=None)
+def load_master_opencv(source_path):
+    """Decode a master image once with OpenCV as premultiplied 8-bit BGRA, or BGR if opaque"""
+    img = cv2.imread(source_path, cv2.IMREAD_UNCHANGED)
+    if img is None:
+        raise ValueError(f"OpenCV cannot read {source_path}")
+    if img.dtype != np.uint8:
+        img = cv2.convertScaleAbs(img, alpha=255 / 65535)
+    if img.ndim == 2:
+        img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+    if img.shape[2] == 3:
+        # Opaque master: stay 3-channel to save a quarter of the memory and resampling work
+        return img
+    return premultiply_alpha(img)
+
+def render_png_opencv(source_path, size, maintain_aspect=True, adaptive_icon_safe_margin=False, downscale_chain=None):
+    """
+    Resize a master image with OpenCV - same arguments and output geometry as render_png
+    
+    Downscales use INTER_AREA (OpenCV's anti-aliased decimation filter) and upscales
+    use INTER_LANCZOS4, both on premultiplied alpha like Pillow. Resizes always start
+    from the master, so downscale_chain is accepted for compatibility but not used.
     
     Returns:
-        bool: True if successful, False otherwise
+        bytes: Encoded PNG image
     """
+    master = load_master_opencv(source_path)
+    master_size = (master.shape[1], master.shape[0])
+    target_size = get_fit_size(master_size, get_fit_box(size, adaptive_icon_safe_margin)) if maintain_aspect else size
+    
+    shrinking = target_size[0] <= master_size[0] and target_size[1] <= master_size[1]
+    interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_LANCZOS4
+    img = cv2.resize(master, target_size, interpolation=interpolation)
+    if img.shape[2] == 4:
+        img = unpremultiply_alpha(img)
+    
+    # Images that already fill the canvas exactly need no transparent padding
+    if maintain_aspect and target_size != size:
+        if img.shape[2] == 3:
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
+        
+        # Center the resized image on a transparent canvas, writing zeros only
+        # into the margins rather than clearing the whole canvas first
+        x = (size[0] - target_size[0]) // 2
+        y = (size[1] - target_size[1]) // 2
+        img = cv2.copyMakeBorder(img, y, size[1] - target_size[1] - y, x, size[0] - target_size[0] - x,
+                                 cv2.BORDER_CONSTANT, value=(0, 0, 0, 0))
+    
+    success, encoded = cv2.imencode('.png', img, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+    if not success:
+        raise ValueError("cv2.imencode failed")
+    return encoded.tobytes()
+
+def get_master_records(master_images, master_entries):
+    """Get a [size, mtime_ns] record for each master image, keyed by file name (stat'ed directly if not in master_entries)"""
+    records = {}
+    for path in master_images.values():
+        entry = master_entries.get(os.path.basename(path))
+        stat = entry.stat() if entry is not None else os.stat(path)
+        records[os.path.basename(path)] = [stat.st_size, stat.st_mtime_ns]
+    return records
+
+def load_asset_manifest():
+    """Load the asset manifest from the last successful run (empty if missing, unreadable or outdated)"""
     try:
-        with Image.open(source_path) as source_img:
-            # Handle None size (keep original dimensions)
-            if size is None:
-                size = source_img.size
-            
-            # True direct copy optimization for exact size matches
-            if source_img.size == size:
-                ensure_directory(os.path.dirname(output_path))
-                shutil.copy2(source_path, output_path)
-                print(f"✅ Direct copy: {output_path} ({size[0]}x{size[1]})")
-                return True
-            
-            # Convert to RGBA if not already
-            img = source_img.convert('RGBA') if source_img.mode != 'RGBA' else source_img.copy()
-            
-            if maintain_aspect:
-                # Apply safe margin for Android adaptive icons (70% of canvas)
-                if adaptive_icon_safe_margin:
-                    target_size = (int(size[0] * 0.7), int(size[1] * 0.7))
-                    img.thumbnail(target_size, Image.Resampling.LANCZOS)
-                else:
-                    img.thumbnail(size, Image.Resampling.LANCZOS)
-                
-                # Create new image with transparent background and center the resized image
-                new_img = Image.new('RGBA', size, (0, 0, 0, 0))
-                x = (size[0] - img.width) // 2
-                y = (size[1] - img.height) // 2
-                new_img.paste(img, (x, y), img)
-                img = new_img
-            else:
-                # Stretch to exact size
-                img = img.resize(size, Image.Resampling.LANCZOS)
-            
-            # Save as PNG with transparency and quality preservation
-            ensure_directory(os.path.dirname(output_path))
-            img.save(output_path, 'PNG', optimize=False)
-            print(f"✅ Created: {output_path} ({size[0]}x{size[1]})")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Error creating {output_path}: {e}")
+        with open(get_project_path(ASSET_MANIFEST_PATH), 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != ASSET_MANIFEST_VERSION:
+        return {}
+    return manifest
+
+def get_script_record():
+    """Get a [size, mtime_ns] record for this script, so edits to it invalidate the manifest"""
+    stat = os.stat(os.path.abspath(__file__))
+    return [stat.st_size, stat.st_mtime_ns]
+
+def save_asset_manifest(master_records, backend, output_paths):
+    """Record the master images, backend and outputs of a successful run"""
+    manifest = {
+        "version": ASSET_MANIFEST_VERSION,
+        "backend": backend,
+        "script": get_script_record(),
+        "masters": master_records,
+        "outputs": sorted({os.path.relpath(path, PROJECT_ROOT) for path in output_paths}),
+    }
+    try:
+        write_json_if_changed(get_project_path(ASSET_MANIFEST_PATH), manifest)
+    except OSError as e:
+        print(f"Warning: could not save asset manifest: {e}")
+
+def is_manifest_usable(manifest, backend):
+    """
+    Check that a manifest was saved by this script with this backend
+    
+    Its master records are only trusted then, as the script's size tables decide
+    which outputs and sizes are expected.
+    """
+    return bool(manifest) and manifest.get("backend") == backend and manifest.get("script") == get_script_record()
+
+def get_unchanged_masters(master_images, master_records, manifest, backend):
+    """Get the paths of master images that match a usable manifest (see is_manifest_usable) of the last successful run"""
+    if not is_manifest_usable(manifest, backend):
+        return set()
+    recorded = manifest.get("masters", {})
+    return {path for path in master_images.values()
+            if recorded.get(os.path.basename(path)) == master_records[os.path.basename(path)]}
+
+def is_build_current(master_images, unchanged_masters, manifest):
+    """Check that no master or this script changed since the last successful run and all its outputs still exist"""
+    if len(unchanged_masters) < len(master_images):
         return False
+    return all(os.path.exists(get_project_path(path)) for path in manifest.get("outputs", ()))
+
+def is_output_current(source_path, output_path, size):
+    """Check whether an output is newer than its master and already at the target size"""
+    try:
+        if os.path.getmtime(output_path) < os.path.getmtime(source_path):
+            return False
+        with Image.open(output_path) as existing_img:
+            return existing_img.size == (size or get_master_size(source_path))
+    except OSError:
+        return False
+
+def get_temp_path(path):
+    """
+    Get a temporary path next to a file for writing it before a rename
+    
+    The name is hidden (dot-prefixed, so build tools such as aapt ignore it if it is
+    ever left behind) and unique to this process and thread.
+    """
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.{os.getpid()}-{threading.get_ident()}.tmp")
+
+def replace_via_temp(path, write_temp):
+    """Call write_temp with a temporary path, then rename it over path (the temporary file is removed on failure)"""
+    tmp_path = get_temp_path(path)
+    try:
+        write_temp(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def atomic_write_bytes(path, data):
+    """Replace a file with the given bytes using one write() to a temporary file and a rename"""
+    def write_temp(tmp_path):
+        # O_BINARY stops the Windows CRT translating \n to \r\n (it doesn't exist elsewhere)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
+    replace_via_temp(path, write_temp)
+
+def write_output(output_path, data, link_source=None):
+    """
+    Write encoded image bytes to an output path
+    
+    Outputs are replaced atomically rather than rewritten in place, so an existing
+    hard link to another output is broken instead of modified.
+    
+    Args:
+        output_path: Path for output image
+        data: Encoded image bytes
+        link_source: Optional already written output with identical bytes; the
+                     output is hard linked to it instead of written again
+    """
+    if link_source == output_path:
+        return
+    if link_source is not None:
+        try:
+            replace_via_temp(output_path, lambda tmp_path: os.link(link_source, tmp_path))
+            return
+        except OSError:
+            pass  # Hard links unsupported here - fall back to writing a copy
+    atomic_write_bytes(output_path, data)
+
+# Output writes are handed to a background thread in each worker process so file
+# I/O overlaps with resampling the next size; failures are collected per path
+_WRITE_QUEUE = queue.Queue()
+_WRITE_ERRORS = {}
+_writer_thread = None
+
+def _write_worker():
+    """Drain the write queue forever, recording any failed writes"""
+    while True:
+        output_path, data, link_source = _WRITE_QUEUE.get()
+        try:
+            write_output(output_path, data, link_source)
+        except OSError as e:
+            _WRITE_ERRORS[output_path] = e
+        finally:
+            _WRITE_QUEUE.task_done()
+
+def queue_write(output_path, data, link_source=None):
+    """Queue encoded image bytes to be written (or linked, see write_output) by the background writer thread"""
+    global _writer_thread
+    if _writer_thread is None:
+        _writer_thread = threading.Thread(target=_write_worker, daemon=True)
+        _writer_thread.start()
+    _WRITE_QUEUE.put((output_path, data, link_source))
+
+def flush_writes():
+    """
+    Wait until every queued write has finished
+    
+    Returns:
+        dict: Output paths that failed to write, mapped to their errors
+    """
+    _WRITE_QUEUE.join()
+    errors = dict(_WRITE_ERRORS)
+    _WRITE_ERRORS.clear()
+    return errors
+
+def render_output(render_key, downscale_chain=None, backend="pillow"):
+    """
+    Produce the encoded PNG bytes for one unique rendition
+    
+    Args:
+        render_key: Job.render_key tuple (master, size, maintain_aspect, margin)
+        downscale_chain: Optional downscale chain passed through to render_png
+        backend: Resize implementation to use, one of RESIZE_BACKENDS
+    
+    Returns:
+        tuple: (PNG bytes, True if the master was used as-is)
+    """
+    source_path, size, maintain_aspect, adaptive_icon_safe_margin = render_key
+    
+    if get_master_size(source_path) == size:
+        # True direct copy optimization for exact size matches (no decode needed)
+        with open(source_path, 'rb') as f:
+            return f.read(), True
+    
+    render = render_png_opencv if backend == "opencv" else render_png
+    return render(source_path, size, maintain_aspect, adaptive_icon_safe_margin, downscale_chain), False
+
+def resize_batch(jobs, backend="pillow", skipped_jobs=()):
+    """
+    Run a batch of resize jobs sharing one master image in the current process
+    
+    Jobs are grouped by render key so each unique rendition is produced once. It is
+    written once per output directory, and other outputs in the same directory (e.g.
+    AppIcon.appiconset aliases) are hard linked to that file. Outputs for other
+    platforms get real copies, so editing one in place can't change the others.
+    Aspect-preserving renditions run largest target first along a single downscale
+    chain, so smaller outputs are resampled from earlier results instead of the full
+    master. Renditions of skipped jobs that come earlier in the chain are resampled
+    too (but not encoded or written), so each output is the same whichever other
+    outputs are pending. Writes finish in the background and are waited for before
+    the batch returns.
+    
+    Args:
+        jobs: List of Job instances for one master image
+        backend: Resize implementation to use, one of RESIZE_BACKENDS
+        skipped_jobs: Up-to-date Job instances for the same master
+    
+    Returns:
+        list: Success flag for each job, in job order
+    """
+    def chain_order(render_key):
+        _, size, maintain_aspect, adaptive_icon_safe_margin = render_key
+        if not maintain_aspect:
+            return (0, render_key)
+        return (-math.prod(get_fit_box(size, adaptive_icon_safe_margin)), render_key)
+    
+    plan = group_by(jobs, key=lambda job: job.render_key)
+    render_keys = sorted(plan, key=chain_order)
+    
+    # Only Pillow resamples along the chain, and only up to the last pending rendition on it
+    pending_chain = [render_key for render_key in render_keys if render_key[2]]
+    chain_keys = set()
+    if backend == "pillow" and pending_chain:
+        chain_keys = {job.render_key for job in skipped_jobs
+                      if job.render_key[2] and chain_order(job.render_key) < chain_order(pending_chain[-1])}
+    
+    succeeded = set()
+    statuses = []
+    downscale_chain = []
+    for render_key in sorted(chain_keys.union(plan), key=chain_order):
+        source_path, size, _, adaptive_icon_safe_margin = render_key
+        if render_key not in plan:
+            # Direct copies never join the chain (see render_output); a master that
+            # can't be resampled is reported by the pending renditions below
+            try:
+                if get_master_size(source_path) != size:
+                    resize_to_fit(source_path, get_fit_box(size, adaptive_icon_safe_margin), downscale_chain)
+            except Exception:
+                pass
+            continue
+        
+        group = plan[render_key]
+        try:
+            data, direct_copy = render_output(render_key, downscale_chain, backend)
+        except Exception as e:
+            for job in group:
+                print(f"❌ Error creating {job.out}: {e}")
+            continue
+        
+        written_dirs = {}
+        for job in group:
+            output_dir = os.path.dirname(job.out)
+            link_source = written_dirs.setdefault(output_dir, job.out)
+            # Some paths are listed twice (e.g. splash-2732x2732.png) and are written once
+            if job.out not in succeeded:
+                queue_write(job.out, data, link_source=link_source if link_source != job.out else None)
+            action = "Direct copy" if direct_copy else "Created" if link_source == job.out else "Linked"
+            statuses.append((job.out, f"{action}: {job.out} ({size[0]}x{size[1]})"))
+            succeeded.add(job.out)
+    
+    # Report each output once its write has actually finished
+    errors = flush_writes()
+    for output_path, status in statuses:
+        if output_path in errors:
+            print(f"❌ Error writing {output_path}: {errors[output_path]}")
+            succeeded.discard(output_path)
+        else:
+            print(f"✅ {status}")
+    
+    return [job.out in succeeded for job in jobs]
+
+def run_resize_jobs(jobs, force=False, backend="pillow", unchanged_masters=frozenset(), changed_masters=frozenset(),
+                    while_resizing=None):
+    """
+    Run resize jobs in parallel across all CPU cores
+    
+    Jobs are batched per master image so each worker decodes a master only once,
+    and the batches with the most output pixels are submitted first so the large
+    splash sets don't end up running alone at the tail. Outputs of unchanged masters
+    are skipped as long as they exist, outputs of changed masters are always
+    regenerated, and any other output is skipped if it is newer than its master and
+    already at its size. Nothing is skipped when forced.
+    
+    Args:
+        jobs: List of Job instances
+        force: Regenerate outputs even if they are up to date
+        backend: Resize implementation to use, one of RESIZE_BACKENDS
+        unchanged_masters: Master paths unchanged since the last successful run
+        changed_masters: Master paths known to differ from the last successful run
+        while_resizing: Optional callable run on the main thread once every worker
+            process has started, overlapping with the resizing
+    
+    Returns:
+        list: Success flag for each job, in job order (skipped jobs count as successful)
+    """
+    def is_current(job):
+        if job.master in changed_masters:
+            return False
+        if job.master in unchanged_masters:
+            return os.path.exists(job.out)
+        return is_output_current(job.master, job.out, job.size)
+    
+    # Skip outputs that are already up to date
+    pending = [index for index, job in enumerate(jobs) if force or not is_current(job)]
+    if len(pending) < len(jobs):
+        print(f"↷ Skipping {len(jobs) - len(pending)} images that are already up to date (use --force to regenerate)")
+    
+    print(f"Resizing {len(pending)} images with {backend} across {os.cpu_count()} CPU cores...")
+    results = [True] * len(jobs)
+    pending_set = set(pending)
+    skipped_jobs = group_by((job for index, job in enumerate(jobs) if index not in pending_set),
+                            key=lambda job: job.master)
+    if not pending:
+        if while_resizing is not None:
+            while_resizing()
+        return results
+    
+    # Group job indexes by master image path, largest total output area first
+    batches = sorted(group_by(pending, key=lambda index: jobs[index].master).values(),
+                     key=lambda indexes: -sum(math.prod(jobs[index].size) for index in indexes))
+    
+    # Flush pending output so forked workers don't inherit and re-emit it
+    sys.stdout.flush()
+    
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {
+            executor.submit(resize_batch, [jobs[index] for index in indexes], backend,
+                            skipped_jobs.get(jobs[indexes[0]].master, [])): indexes
+            for indexes in batches
+        }
+        # Workers are forked on the first submit, so no other thread exists yet
+        if while_resizing is not None:
+            while_resizing()
+        for future in as_completed(futures):
+            indexes = futures[future]
+            try:
+                batch_results = future.result()
+            except Exception as e:
+                # A crashed worker or an unpicklable job fails the whole batch
+                for index in indexes:
+                    print(f"❌ Error resizing {jobs[index].out}: {e}")
+                batch_results = [False] * len(indexes)
+            for index, success in zip(indexes, batch_results):
+                results[index] = success
+    
+    return results
+
+def print_job_plan(jobs):
+    """Print the unique renditions and the outputs each one is written to, without writing anything"""
+    plan = group_by(jobs, key=lambda job: job.render_key)
+    for (source_path, size, maintain_aspect, adaptive_icon_safe_margin), group in plan.items():
+        mode = "fit" if maintain_aspect else "stretch"
+        if adaptive_icon_safe_margin:
+            mode += ", 70% safe margin"
+        print(f"{os.path.basename(source_path)} -> {size[0]}x{size[1]} ({mode})")
+        for job in group:
+            print(f"   {os.path.relpath(job.out, PROJECT_ROOT)}")
+    print(f"\n{len(jobs)} images from {len(plan)} unique renditions")
 
 #==============================================================================
 # WEB PWA ASSET GENERATION
 #==============================================================================
 
 def generate_web_icons(icon_master_path):
-    """Generate web PWA icons"""
-    print("Generating Web PWA icons...")
+    """Collect web PWA icon resize jobs"""
+    print("Queueing Web PWA icons...")
     
     web_sizes = [
         (192, 192),  # PWA manifest standard
         (512, 512),  # PWA manifest large
     ]
     
-    ensure_directory(get_project_path("public/icons"))
-    
-    success_count = 0
+    jobs = []
     for size in web_sizes:
         output_path = get_project_path(f"public/icons/icon-{size[0]}x{size[1]}.png")
-        if resize_image(icon_master_path, output_path, size):
-            success_count += 1
+        jobs.append(Job(icon_master_path, size, output_path))
     
-    print(f"✅ Web PWA icons: {success_count}/{len(web_sizes)} generated")
-    return success_count
+    return jobs
 
 def generate_web_logos(logo_master_path):
-    """Generate web header logos and responsive icon assets"""
-    print("Generating Web header logos and responsive assets...")
+    """Collect web header logo and responsive icon asset resize jobs"""
+    print("Queueing Web header logos and responsive assets...")
     
-    ensure_directory(get_project_path("public/icons"))
-    ensure_directory(get_project_path("client/src/assets"))
-    
-    success_count = 0
+    jobs = []
     
     # Logo variants at different DPI levels
     logo_variants = [
@@ -199,43 +822,27 @@ def generate_web_logos(logo_master_path):
     icon_variants = [
         ((64, 64), get_project_path("client/src/assets/icon-64x64.png")),     # 1x for standard displays
         ((128, 128), get_project_path("client/src/assets/icon-128x128.png")), # 2x for retina displays
+        ((192, 192), get_project_path("client/src/assets/icon-192x192.png")), # PWA icon for import consistency
     ]
     
     # Generate logo variants
     for size, output_path in logo_variants:
-        if resize_image(logo_master_path, output_path, size, maintain_aspect=True):
-            success_count += 1
+        jobs.append(Job(logo_master_path, size, output_path))
     
     # Generate icon variants from icon master
     if os.path.exists(icon_master_path):
         for size, output_path in icon_variants:
-            if resize_image(icon_master_path, output_path, size, maintain_aspect=True):
-                success_count += 1
+            jobs.append(Job(icon_master_path, size, output_path))
     else:
         print("Warning: icon-master.png not found - skipping icon variants")
     
-    # Copy 192x192 icon to assets folder for import consistency
-    icon_192_path = get_project_path("public/icons/icon-192x192.png")
-    if os.path.exists(icon_192_path):
-        try:
-            shutil.copy2(icon_192_path, get_project_path("client/src/assets/icon-192x192.png"))
-            print("✅ Copied: icon-192x192.png to assets folder")
-            success_count += 1  # Count copy operations as files placed in destinations
-        except Exception as e:
-            print(f"❌ Error copying icon to assets: {e}")
-    
-    total_expected = len(logo_variants) + len(icon_variants) + 1  # Include copy operation
-    print(f"✅ Web logos and assets: {success_count}/{total_expected} generated")
-    return success_count
+    return jobs
 
 def generate_web_logos_inverted(logo_inverted_master_path):
-    """Generate web header inverted logos and responsive icon assets"""
-    print("Generating Web header inverted logos and responsive assets...")
-    
-    ensure_directory(get_project_path("public/icons"))
-    ensure_directory(get_project_path("client/src/assets"))
+    """Collect web header inverted logo resize jobs"""
+    print("Queueing Web header inverted logos and responsive assets...")
     
-    success_count = 0
+    jobs = []
     
     # Logo variants at different DPI levels
     logo_variants = [
@@ -247,19 +854,17 @@ def generate_web_logos_inverted(logo_inverted_master_path):
     
     # Generate logo variants
     for size, output_path in logo_variants:
-        if resize_image(logo_inverted_master_path, output_path, size, maintain_aspect=True):
-            success_count += 1
+        jobs.append(Job(logo_inverted_master_path, size, output_path))
     
-    print(f"✅ Web inverted logos and assets: {success_count}/{len(logo_variants)} generated")
-    return success_count
+    return jobs
 
 #==============================================================================
 # iOS ASSET GENERATION
 #==============================================================================
 
 def generate_ios_icons(icon_master_path):
-    """Generate iOS app icons - complete set to override Capacitor defaults"""
-    print("Generating iOS app icons...")
+    """Collect iOS app icon resize jobs - complete set to override Capacitor defaults"""
+    print("Queueing iOS app icons...")
     
     # Standard iOS icon sizes
     ios_sizes = [
@@ -304,29 +909,23 @@ def generate_ios_icons(icon_master_path):
         ("AppIcon-83.5x83.5@2x.png", (167, 167)),
     ]
     
-    ensure_directory("ios/App/App/Assets.xcassets/AppIcon.appiconset")
-    
-    success_count = 0
+    jobs = []
     
     # Generate standard iOS icons
     for size in ios_sizes:
-        output_path = f"ios/App/App/Assets.xcassets/AppIcon.appiconset/icon-{size[0]}x{size[1]}.png"
-        if resize_image(icon_master_path, output_path, size):
-            success_count += 1
+        output_path = get_project_path(f"ios/App/App/Assets.xcassets/AppIcon.appiconset/icon-{size[0]}x{size[1]}.png")
+        jobs.append(Job(icon_master_path, size, output_path))
     
     # Generate Capacitor default naming convention to override defaults
     for filename, size in capacitor_appicon_defaults:
-        output_path = f"ios/App/App/Assets.xcassets/AppIcon.appiconset/{filename}"
-        if resize_image(icon_master_path, output_path, size):
-            success_count += 1
+        output_path = get_project_path(f"ios/App/App/Assets.xcassets/AppIcon.appiconset/{filename}")
+        jobs.append(Job(icon_master_path, size, output_path))
     
-    total_expected = len(ios_sizes) + len(capacitor_appicon_defaults)
-    print(f"✅ iOS app icons: {success_count}/{total_expected} generated")
-    return success_count
+    return jobs
 
 def generate_ios_logos(logo_master_path):
-    """Generate iOS header logos"""
-    print("Generating iOS header logos...")
+    """Collect iOS header logo resize jobs"""
+    print("Queueing iOS header logos...")
     
     ios_logo_sizes = [
         ("logo.png", (120, 32)),      # 1x density
@@ -335,20 +934,16 @@ def generate_ios_logos(logo_master_path):
         ("logo@4x.png", (480, 128)),  # 4x density (direct from master)
     ]
     
-    ensure_directory("ios/App/App/Assets.xcassets/Logo.imageset")
-    
-    success_count = 0
+    jobs = []
     for filename, size in ios_logo_sizes:
-        output_path = f"ios/App/App/Assets.xcassets/Logo.imageset/{filename}"
-        if resize_image(logo_master_path, output_path, size, maintain_aspect=True):
-            success_count += 1
+        output_path = get_project_path(f"ios/App/App/Assets.xcassets/Logo.imageset/{filename}")
+        jobs.append(Job(logo_master_path, size, output_path))
     
-    print(f"✅ iOS header logos: {success_count}/{len(ios_logo_sizes)} generated")
-    return success_count
+    return jobs
 
 def generate_ios_logos_inverted(logo_inverted_master_path):
-    """Generate iOS header inverted logos"""
-    print("Generating iOS header inverted logos...")
+    """Collect iOS header inverted logo resize jobs"""
+    print("Queueing iOS header inverted logos...")
     
     ios_logo_sizes = [
         ("logo-inverted.png", (120, 32)),      # 1x density
@@ -357,79 +952,88 @@ def generate_ios_logos_inverted(logo_inverted_master_path):
         ("logo-inverted@4x.png", (480, 128)),  # 4x density (direct from master)
     ]
     
-    ensure_directory("ios/App/App/Assets.xcassets/LogoInverted.imageset")
-    
-    success_count = 0
+    jobs = []
     for filename, size in ios_logo_sizes:
-        output_path = f"ios/App/App/Assets.xcassets/LogoInverted.imageset/{filename}"
-        if resize_image(logo_inverted_master_path, output_path, size, maintain_aspect=True):
-            success_count += 1
+        output_path = get_project_path(f"ios/App/App/Assets.xcassets/LogoInverted.imageset/{filename}")
+        jobs.append(Job(logo_inverted_master_path, size, output_path))
     
-    print(f"✅ iOS header inverted logos: {success_count}/{len(ios_logo_sizes)} generated")
-    return success_count
+    return jobs
 
 #==============================================================================
 # ANDROID ASSET GENERATION
 #==============================================================================
 
 def generate_android_icons(icon_master_path):
-    """Generate Android app icons - complete set to override Capacitor defaults"""
-    print("Generating Android app icons...")
+    """
+    Collect Android app icon resize jobs - complete set to override Capacitor defaults
     
-    android_densities = [
-        ("ldpi", 36),     # Low density
-        ("mdpi", 48),     # Medium density
-        ("hdpi", 72),     # High density
-        ("xhdpi", 96),    # Extra high density
-        ("xxhdpi", 144),  # Extra extra high density
-        ("xxxhdpi", 192), # Extra extra extra high density
-    ]
+    Densities are queued largest first so the icons form one downscale pyramid.
+    The round launcher icon is identical to the standard one and is written from
+    the same render; foregrounds form a second pyramid at the 70% safe margin.
+    """
+    print("Queueing Android app icons...")
     
-    success_count = 0
-    for density, size in android_densities:
-        dir_path = f"android/app/src/main/res/mipmap-{density}"
-        ensure_directory(dir_path)
+    jobs = []
+    for density, size in reversed(ANDROID_ICON_SIZES):
+        dir_path = get_project_path(f"android/app/src/main/res/mipmap-{density}")
         
         # Standard launcher icon
-        output_path = f"{dir_path}/ic_launcher.png"
-        if resize_image(icon_master_path, output_path, (size, size)):
-            success_count += 1
+        output_path = os.path.join(dir_path, "ic_launcher.png")
+        jobs.append(Job(icon_master_path, (size, size), output_path))
         
         # Round launcher icon
-        output_path_round = f"{dir_path}/ic_launcher_round.png"
-        if resize_image(icon_master_path, output_path_round, (size, size)):
-            success_count += 1
+        output_path_round = os.path.join(dir_path, "ic_launcher_round.png")
+        jobs.append(Job(icon_master_path, (size, size), output_path_round))
         
         # Foreground for adaptive icons (apply 70% safe margin)
-        output_path_fg = f"{dir_path}/ic_launcher_foreground.png"
-        if resize_image(icon_master_path, output_path_fg, (size, size), maintain_aspect=True, adaptive_icon_safe_margin=True):
-            success_count += 1
+        output_path_fg = os.path.join(dir_path, "ic_launcher_foreground.png")
+        jobs.append(Job(icon_master_path, (size, size), output_path_fg, margin=True))
+    
+    # Create Play Store icon
+    play_store_path = get_project_path("android/app/src/main/res/mipmap-xxxhdpi/ic_launcher_playstore.png")
+    jobs.append(Job(icon_master_path, (512, 512), play_store_path))
+    
+    return jobs
+
+# Encoded fully transparent square PNGs keyed by edge length
+_TRANSPARENT_PNG_CACHE = {}
+
+def get_transparent_png(size):
+    """Get PNG bytes for a fully transparent square image, encoding each size once"""
+    if size not in _TRANSPARENT_PNG_CACHE:
+        buffer = io.BytesIO()
+        Image.new('RGBA', (size, size), (0, 0, 0, 0)).save(buffer, 'PNG', optimize=True)
+        _TRANSPARENT_PNG_CACHE[size] = buffer.getvalue()
+    return _TRANSPARENT_PNG_CACHE[size]
+
+def generate_android_icon_backgrounds():
+    """
+    Generate transparent Android adaptive icon backgrounds
+    
+    Returns:
+        list: Paths of the backgrounds written successfully
+    """
+    print("Generating Android adaptive icon backgrounds...")
+    
+    written_paths = []
+    for density, size in ANDROID_ICON_SIZES:
+        dir_path = get_project_path(f"android/app/src/main/res/mipmap-{density}")
         
         # Background for adaptive icons (transparent background)
-        output_path_bg = f"{dir_path}/ic_launcher_background.png"
+        output_path_bg = os.path.join(dir_path, "ic_launcher_background.png")
         try:
-            bg_img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-            bg_img.save(output_path_bg, 'PNG', optimize=True)
-            success_count += 1
+            with open(output_path_bg, 'wb') as f:
+                f.write(get_transparent_png(size))
+            written_paths.append(output_path_bg)
         except Exception as e:
             print(f"❌ Error creating {output_path_bg}: {e}")
     
-    # Create Play Store icon
-    ensure_directory("android/app/src/main/res/mipmap-xxxhdpi")
-    play_store_path = "android/app/src/main/res/mipmap-xxxhdpi/ic_launcher_playstore.png"
-    if resize_image(icon_master_path, play_store_path, (512, 512)):
-        success_count += 1
-    
-    # Create adaptive icon XML files
-    create_android_adaptive_icon_xmls()
-    success_count += 2  # For the 2 XML files
-    
-    print(f"✅ Android app icons: {success_count}/{len(android_densities) * 4 + 3} generated")
-    return success_count
+    print(f"✅ Android adaptive icon backgrounds: {len(written_paths)}/{len(ANDROID_ICON_SIZES)} generated")
+    return written_paths
 
 def generate_android_logos(logo_master_path):
-    """Generate Android header logos"""
-    print("Generating Android header logos...")
+    """Collect Android header logo resize jobs"""
+    print("Queueing Android header logos...")
     
     android_densities = [
         ("ldpi", 0.75),    # 90x24
@@ -440,31 +1044,26 @@ def generate_android_logos(logo_master_path):
         ("xxxhdpi", 4.0),  # 480x128 (matches master)
     ]
     
-    success_count = 0
+    jobs = []
     for density, scale in android_densities:
         dir_path = get_project_path(f"android/app/src/main/res/drawable-{density}")
-        ensure_directory(dir_path)
         
         # Calculate scaled dimensions from 120x32 base
         scaled_width = int(120 * scale)
         scaled_height = int(32 * scale)
         
-        output_path = f"{dir_path}/logo.png"
-        if resize_image(logo_master_path, output_path, (scaled_width, scaled_height), maintain_aspect=True):
-            success_count += 1
+        output_path = os.path.join(dir_path, "logo.png")
+        jobs.append(Job(logo_master_path, (scaled_width, scaled_height), output_path))
     
     # Create base logo in drawable folder at 1x size
-    ensure_directory(get_project_path("android/app/src/main/res/drawable"))
     base_logo_path = get_project_path("android/app/src/main/res/drawable/logo.png")
-    if resize_image(logo_master_path, base_logo_path, (120, 32), maintain_aspect=True):
-        success_count += 1
+    jobs.append(Job(logo_master_path, (120, 32), base_logo_path))
     
-    print(f"✅ Android header logos: {success_count}/{len(android_densities) + 1} generated")
-    return success_count
+    return jobs
 
 def generate_android_logos_inverted(logo_inverted_master_path):
-    """Generate Android header inverted logos"""
-    print("Generating Android header inverted logos...")
+    """Collect Android header inverted logo resize jobs"""
+    print("Queueing Android header inverted logos...")
     
     android_densities = [
         ("ldpi", 0.75),    # 90x24
@@ -475,63 +1074,63 @@ def generate_android_logos_inverted(logo_inverted_master_path):
         ("xxxhdpi", 4.0),  # 480x128 (matches master)
     ]
     
-    success_count = 0
+    jobs = []
     for density, scale in android_densities:
         dir_path = get_project_path(f"android/app/src/main/res/drawable-{density}")
-        ensure_directory(dir_path)
         
         # Calculate scaled dimensions from 120x32 base
         scaled_width = int(120 * scale)
         scaled_height = int(32 * scale)
         
-        output_path = f"{dir_path}/logo_inverted.png"
-        if resize_image(logo_inverted_master_path, output_path, (scaled_width, scaled_height), maintain_aspect=True):
-            success_count += 1
+        output_path = os.path.join(dir_path, "logo_inverted.png")
+        jobs.append(Job(logo_inverted_master_path, (scaled_width, scaled_height), output_path))
     
     # Create base inverted logo in drawable folder at 1x size
-    ensure_directory(get_project_path("android/app/src/main/res/drawable"))
     base_logo_path = get_project_path("android/app/src/main/res/drawable/logo_inverted.png")
-    if resize_image(logo_inverted_master_path, base_logo_path, (120, 32), maintain_aspect=True):
-        success_count += 1
+    jobs.append(Job(logo_inverted_master_path, (120, 32), base_logo_path))
     
-    print(f"✅ Android header inverted logos: {success_count}/{len(android_densities) + 1} generated")
-    return success_count
+    return jobs
 
-def create_android_adaptive_icon_xmls():
-    """Create Android adaptive icon XML files"""
-    print("Creating Android adaptive icon XML files...")
-    
-    # Create adaptive icon directory
-    ensure_directory(get_project_path("android/app/src/main/res/mipmap-anydpi-v26"))
-    
-    # Standard adaptive icon XML
-    ic_launcher_xml = '''<?xml version="1.0" encoding="utf-8"?>
+# Adaptive icon XML shared by the standard and round launcher icons
+ADAPTIVE_ICON_XML = '''<?xml version="1.0" encoding="utf-8"?>
 <adaptive-icon xmlns:android="http://schemas.android.com/apk/res/android">
     <background android:drawable="@color/ic_launcher_background"/>
     <foreground android:drawable="@mipmap/ic_launcher_foreground"/>
 </adaptive-icon>'''
+
+def create_android_adaptive_icon_xmls():
+    """
+    Create Android adaptive icon XML files (the round icon is identical to the standard one)
     
-    # Round adaptive icon XML
-    ic_launcher_round_xml = '''<?xml version="1.0" encoding="utf-8"?>
-<adaptive-icon xmlns:android="http://schemas.android.com/apk/res/android">
-    <background android:drawable="@color/ic_launcher_background"/>
-    <foreground android:drawable="@mipmap/ic_launcher_foreground"/>
-</adaptive-icon>'''
+    Returns:
+        list: Paths of the XML files written
+    """
+    print("Creating Android adaptive icon XML files...")
+    
+    ic_launcher_path = get_project_path("android/app/src/main/res/mipmap-anydpi-v26/ic_launcher.xml")
+    ic_launcher_round_path = get_project_path("android/app/src/main/res/mipmap-anydpi-v26/ic_launcher_round.xml")
     
-    # Write XML files
-    with open(get_project_path("android/app/src/main/res/mipmap-anydpi-v26/ic_launcher.xml"), 'w') as f:
-        f.write(ic_launcher_xml)
+    # Write the XML once, then hard link the round variant to it
+    with open(ic_launcher_path, 'w') as f:
+        f.write(ADAPTIVE_ICON_XML)
+    
+    if os.path.lexists(ic_launcher_round_path):
+        os.remove(ic_launcher_round_path)
+    try:
+        os.link(ic_launcher_path, ic_launcher_round_path)
+    except OSError:
+        # Hard links unsupported on this filesystem - fall back to a copy
+        shutil.copy2(ic_launcher_path, ic_launcher_round_path)
     
-    with open(get_project_path("android/app/src/main/res/mipmap-anydpi-v26/ic_launcher_round.xml"), 'w') as f:
-        f.write(ic_launcher_round_xml)
+    return [ic_launcher_path, ic_launcher_round_path]
 
 #==============================================================================
 # SPLASH SCREEN GENERATION
 #==============================================================================
 
 def generate_splash_screens():
-    """Generate splash screen images using platform-specific masters"""
-    print("Generating splash screens...")
+    """Collect splash screen resize jobs using platform-specific masters"""
+    print("Queueing splash screens...")
     
     # Master image paths
     ios_master = get_project_path("master-images/splash-square-master.png")
@@ -542,7 +1141,7 @@ def generate_splash_screens():
     for master_path in [ios_master, android_portrait_master, android_landscape_master]:
         if not os.path.exists(master_path):
             print(f"❌ Master image not found: {master_path}")
-            return
+            return []
     
     # iOS splash sizes
     ios_splash_sizes = [
@@ -561,23 +1160,17 @@ def generate_splash_screens():
         ("xxxhdpi", 1280, 1920), # Extra extra extra high density - 4.0x multiplier
     ]
     
-    ensure_directory(get_project_path("public/splash"))
-    ensure_directory(get_project_path("ios/App/App/Assets.xcassets/Splash.imageset"))
-    ensure_directory(get_project_path("android/app/src/main/res/drawable"))
-    
-    success_count = 0
+    jobs = []
     
     # Generate web splash screens using iOS master
     for size in ios_splash_sizes:
         web_path = get_project_path(f"public/splash/splash-{size[0]}x{size[1]}.png")
-        if resize_image(ios_master, web_path, size, maintain_aspect=True):
-            success_count += 1
+        jobs.append(Job(ios_master, size, web_path))
     
     # Generate iOS splash screens using square master
     for size in ios_splash_sizes:
         ios_path = get_project_path(f"ios/App/App/Assets.xcassets/Splash.imageset/splash-{size[0]}x{size[1]}.png")
-        if resize_image(ios_master, ios_path, size, maintain_aspect=True):
-            success_count += 1
+        jobs.append(Job(ios_master, size, ios_path))
     
     # Generate Capacitor default splash screen filenames (override defaults)
     capacitor_splash_defaults = [
@@ -588,47 +1181,34 @@ def generate_splash_screens():
     
     for filename in capacitor_splash_defaults:
         ios_default_path = get_project_path(f"ios/App/App/Assets.xcassets/Splash.imageset/{filename}")
-        if resize_image(ios_master, ios_default_path, (2732, 2732), maintain_aspect=True):
-            success_count += 1
+        jobs.append(Job(ios_master, (2732, 2732), ios_default_path))
     
     # Generate Android splash screens using platform-specific masters
     for density, width, height in android_splash_densities:
         # Portrait splash screens using Android portrait master
         port_dir = get_project_path(f"android/app/src/main/res/drawable-port-{density}")
-        ensure_directory(port_dir)
-        port_path = f"{port_dir}/splash.png"
-        if resize_image(android_portrait_master, port_path, (width, height), maintain_aspect=True):
-            success_count += 1
+        port_path = os.path.join(port_dir, "splash.png")
+        jobs.append(Job(android_portrait_master, (width, height), port_path))
         
         # Landscape splash screens using Android landscape master
         land_dir = get_project_path(f"android/app/src/main/res/drawable-land-{density}")
-        ensure_directory(land_dir)
-        land_path = f"{land_dir}/splash.png"
-        if resize_image(android_landscape_master, land_path, (height, width), maintain_aspect=True):
-            success_count += 1
+        land_path = os.path.join(land_dir, "splash.png")
+        jobs.append(Job(android_landscape_master, (height, width), land_path))
     
     # Base Android splash (main drawable folder) using portrait master
     android_path = get_project_path("android/app/src/main/res/drawable/splash.png")
-    if resize_image(android_portrait_master, android_path, (1280, 1920), maintain_aspect=True):
-        success_count += 1
-    
-    total_expected = len(ios_splash_sizes) * 2 + len(capacitor_splash_defaults) + len(android_splash_densities) * 2 + 1
-    print(f"✅ Splash screens: {success_count}/{total_expected} generated")
-    
-    # Generate Android 12+ splash icon from splash-icon-square-master.png
-    splash_icons = generate_android_splash_icons()
-    success_count += splash_icons if splash_icons else 0
+    jobs.append(Job(android_portrait_master, (1280, 1920), android_path))
     
-    return success_count
+    return jobs
 
 def generate_android_splash_icons():
-    """Generate Android 12+ splash icons"""
+    """Collect Android 12+ splash icon resize jobs"""
     splash_icon_master = get_project_path("master-images/splash-icon-square-master.png")
     if not os.path.exists(splash_icon_master):
         print("Warning: splash-icon-square-master.png not found - skipping Android 12+ splash icons")
-        return 0
+        return []
     
-    print("Generating Android 12+ splash icons...")
+    print("Queueing Android 12+ splash icons...")
     splash_icon_sizes = [
         ("mdpi", 96),
         ("hdpi", 144),
@@ -637,118 +1217,164 @@ def generate_android_splash_icons():
         ("xxxhdpi", 384),
     ]
     
-    icon_success_count = 0
+    jobs = []
     for density, size in splash_icon_sizes:
         icon_dir = get_project_path(f"android/app/src/main/res/drawable-{density}")
-        ensure_directory(icon_dir)
-        icon_path = f"{icon_dir}/splash_icon_center.png"
-        if resize_image(splash_icon_master, icon_path, (size, size), maintain_aspect=True):
-            icon_success_count += 1
+        icon_path = os.path.join(icon_dir, "splash_icon_center.png")
+        jobs.append(Job(splash_icon_master, (size, size), icon_path))
     
-    print(f"✅ Android 12+ splash icons: {icon_success_count}/{len(splash_icon_sizes)} generated")
-    return icon_success_count
+    return jobs
 
 #==============================================================================
 # CONFIGURATION FILE GENERATION
 #==============================================================================
 
-def create_ios_contents_json():
-    """Create iOS Contents.json files for Xcode"""
-    print("Creating iOS Contents.json files...")
-    
-    # AppIcon Contents.json - comprehensive mapping for all iOS contexts
-    appicon_contents = {
-        "images": [
-            # iPhone - All contexts including multitasking
-            {"size": "20x20", "idiom": "iphone", "filename": "AppIcon-20x20@2x.png", "scale": "2x"},
-            {"size": "20x20", "idiom": "iphone", "filename": "AppIcon-20x20@3x.png", "scale": "3x"},
-            {"size": "29x29", "idiom": "iphone", "filename": "AppIcon-29x29@2x.png", "scale": "2x"},
-            {"size": "29x29", "idiom": "iphone", "filename": "AppIcon-29x29@3x.png", "scale": "3x"},
-            {"size": "40x40", "idiom": "iphone", "filename": "AppIcon-40x40@2x.png", "scale": "2x"},
-            {"size": "40x40", "idiom": "iphone", "filename": "AppIcon-40x40@3x.png", "scale": "3x"},
-            {"size": "60x60", "idiom": "iphone", "filename": "AppIcon-60x60@2x.png", "scale": "2x"},
-            {"size": "60x60", "idiom": "iphone", "filename": "AppIcon-60x60@3x.png", "scale": "3x"},
-            # iPad - All contexts including multitasking
-            {"size": "20x20", "idiom": "ipad", "filename": "AppIcon-20x20@1x.png", "scale": "1x"},
-            {"size": "20x20", "idiom": "ipad", "filename": "AppIcon-20x20@2x.png", "scale": "2x"},
-            {"size": "29x29", "idiom": "ipad", "filename": "AppIcon-29x29@1x.png", "scale": "1x"},
-            {"size": "29x29", "idiom": "ipad", "filename": "AppIcon-29x29@2x.png", "scale": "2x"},
-            {"size": "40x40", "idiom": "ipad", "filename": "AppIcon-40x40@1x.png", "scale": "1x"},
-            {"size": "40x40", "idiom": "ipad", "filename": "AppIcon-40x40@2x.png", "scale": "2x"},
-            {"size": "76x76", "idiom": "ipad", "filename": "AppIcon-76x76@1x.png", "scale": "1x"},
-            {"size": "76x76", "idiom": "ipad", "filename": "AppIcon-76x76@2x.png", "scale": "2x"},
-            {"size": "83.5x83.5", "idiom": "ipad", "filename": "AppIcon-83.5x83.5@2x.png", "scale": "2x"},
-            # App Store - Critical for distribution
-            {"size": "1024x1024", "idiom": "ios-marketing", "filename": "icon-1024x1024.png", "scale": "1x"}
-        ],
-        "info": {"version": 1, "author": "xcode"}
-    }
+def write_bytes_if_changed(path, data):
+    """
+    Write bytes to a file unless it already holds exactly those bytes
     
-    # Splash Contents.json
-    splash_contents = {
-        "images": [
-            {"idiom": "universal", "filename": "splash-2732x2732.png", "scale": "1x"},
-            {"idiom": "universal", "filename": "splash-1920x1920.png", "scale": "2x"},
-            {"idiom": "universal", "filename": "splash-1024x1024.png", "scale": "3x"}
-        ],
-        "info": {"version": 1, "author": "xcode"}
+    Unchanged files are left untouched so their mtime doesn't invalidate Xcode
+    incremental builds or PWA caches; changed files are replaced atomically.
+    
+    Returns:
+        bool: True if the file was written, False if it was already up to date
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    
+    atomic_write_bytes(path, data)
+    return True
+
+def dump_json(obj):
+    """Serialize an object to JSON bytes, compact unless PRETTY_JSON is set"""
+    if PRETTY_JSON:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+def copy_file_if_changed(source_path, path):
+    """
+    Copy a file into place unless the destination already has identical contents
+    
+    The copy goes through shutil.copyfile (copy_file_range/sendfile on Linux, so no
+    bytes pass through Python) to a temporary file that is renamed into place.
+    
+    Returns:
+        bool: True if the file was copied, False if it was already up to date
+    """
+    if os.path.exists(path) and filecmp.cmp(source_path, path, shallow=False):
+        return False
+    
+    replace_via_temp(path, lambda tmp_path: shutil.copyfile(source_path, tmp_path))
+    return True
+
+def write_json_if_changed(path, obj):
+    """Write an object as JSON unless the file already matches (see write_bytes_if_changed)"""
+    return write_bytes_if_changed(path, dump_json(obj))
+
+# Web manifest icons array
+WEB_MANIFEST_ICONS = [
+    {
+        "src": "/icons/icon-192x192.png",
+        "sizes": "192x192",
+        "type": "image/png"
+    },
+    {
+        "src": "/icons/icon-512x512.png",
+        "sizes": "512x512",
+        "type": "image/png"
     }
+]
+
+def create_ios_contents_json(log=print):
+    """
+    Create iOS Contents.json files for Xcode
     
-    # Write AppIcon Contents.json
-    appicon_dir = get_project_path("ios/App/App/Assets.xcassets/AppIcon.appiconset")
-    ensure_directory(appicon_dir)
-    with open(f"{appicon_dir}/Contents.json", 'w') as f:
-        json.dump(appicon_contents, f, indent=2)
+    Args:
+        log: Called with each progress message (lets a background thread defer output)
     
-    # Write Splash Contents.json
-    splash_dir = get_project_path("ios/App/App/Assets.xcassets/Splash.imageset")
-    ensure_directory(splash_dir)
-    with open(f"{splash_dir}/Contents.json", 'w') as f:
-        json.dump(splash_contents, f, indent=2)
+    Returns:
+        int: Number of Contents.json files written (unchanged files are skipped)
+    """
+    log("Creating iOS Contents.json files...")
+    
+    written = 0
+    for template_name, relative_path in IOS_CONTENTS_TEMPLATES:
+        template_path = os.path.join(TEMPLATE_DIR, template_name)
+        if PRETTY_JSON:
+            # Templates are compact - re-serialize them indented
+            with open(template_path, 'r') as f:
+                written += write_json_if_changed(get_project_path(relative_path), json.load(f))
+        else:
+            written += copy_file_if_changed(template_path, get_project_path(relative_path))
+    
+    return written
+
+def write_config_files(log=print):
+    """Write the iOS Contents.json files and web manifest, then report the Contents.json result"""
+    contents_written = create_ios_contents_json(log)
+    update_manifest_json(log)
+    if contents_written:
+        log(f"✅ iOS Contents.json files written ({contents_written}/2 changed)")
+    else:
+        log("↷ iOS Contents.json files unchanged")
 
-def update_manifest_json():
-    """Update web manifest with new icon paths"""
-    print("Updating web manifest...")
+def update_manifest_json(log=print):
+    """Update web manifest with new icon paths (log works as in create_ios_contents_json)"""
+    log("Updating web manifest...")
     
     manifest_path = get_project_path("public/manifest.json")
     if not os.path.exists(manifest_path):
-        print("Warning: manifest.json not found - skipping update")
+        log("Warning: manifest.json not found - skipping update")
         return
     
     try:
         with open(manifest_path, 'r') as f:
             manifest = json.load(f)
         
-        # Update icons array
-        manifest["icons"] = [
-            {
-                "src": "/icons/icon-192x192.png",
-                "sizes": "192x192",
-                "type": "image/png"
-            },
-            {
-                "src": "/icons/icon-512x512.png",
-                "sizes": "512x512",
-                "type": "image/png"
-            }
-        ]
-        
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        # Update icons array, leaving the file untouched if it already matches
+        if manifest.get("icons") == WEB_MANIFEST_ICONS:
+            log("↷ Web manifest icons unchanged")
+            return
         
-        print("✅ Web manifest updated")
+        manifest["icons"] = WEB_MANIFEST_ICONS
+        if write_json_if_changed(manifest_path, manifest):
+            log("✅ Web manifest updated")
+        else:
+            log("↷ Web manifest unchanged")
     except Exception as e:
-        print(f"❌ Error updating manifest: {e}")
+        log(f"❌ Error updating manifest: {e}")
 
 #==============================================================================
 # MAIN EXECUTION
 #==============================================================================
 
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Generate all platform image assets from master images")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate every image, even if it is newer than its master")
+    parser.add_argument("--backend", choices=RESIZE_BACKENDS, default="pillow",
+                        help="image resize implementation (default: pillow)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="list the planned renditions and outputs without writing anything")
+    return parser.parse_args()
+
 def main():
     """Main function - processes master images and generates all platform assets"""
     
+    args = parse_args()
+    
+    if args.backend == "opencv" and cv2 is None:
+        print("❌ The opencv backend requires OpenCV: pip install opencv-python-headless")
+        sys.exit(1)
+    
     print("Gipity Scaffold - Image Asset Generator")
     print("=" * 50)
+    check_pillow_build()
     
     # Initialize total image counter
     total_images_generated = 0
@@ -764,8 +1390,11 @@ def main():
         "splash_icon": get_project_path("master-images/splash-icon-square-master.png"),
     }
     
-    # Verify all required master images exist
-    missing_images = [path for path in master_images.values() if not os.path.exists(path)]
+    # Verify all required master images exist (one directory read, not a stat per master);
+    # names the scan doesn't match exactly may differ only in case on macOS/Windows
+    master_entries = scan_directory(get_project_path("master-images"))
+    missing_images = [path for path in master_images.values()
+                      if os.path.basename(path) not in master_entries and not os.path.exists(path)]
     
     if missing_images:
         print("❌ Missing required master images:")
@@ -781,64 +1410,117 @@ def main():
         print("   - splash-icon-square-master.png (1024x1024)")
         sys.exit(1)
     
+    # Compare masters against the last successful run to find unchanged ones
+    master_records = get_master_records(master_images, master_entries)
+    manifest = {} if args.force else load_asset_manifest()
+    unchanged_masters = get_unchanged_masters(master_images, master_records, manifest, args.backend)
+    
+    # Masters that differ from a usable manifest are regenerated in full - a replaced
+    # master can carry an older mtime than its outputs (e.g. unzipped or cp -p)
+    changed_masters = set()
+    if is_manifest_usable(manifest, args.backend):
+        changed_masters = set(master_images.values()) - unchanged_masters
+    
+    # Images made by a different backend are regenerated as if forced
+    force = args.force
+    if manifest.get("backend", args.backend) != args.backend:
+        print(f"Backend changed from {manifest['backend']} to {args.backend} - regenerating all images")
+        force = True
+    
     print("Master images verified:")
     for name, path in master_images.items():
-        print(f"   {name}: {os.path.basename(path)}")
+        status = " (unchanged)" if path in unchanged_masters else " (changed)" if path in changed_masters else ""
+        print(f"   {name}: {os.path.basename(path)}{status}")
     print("=" * 50)
     
-    # Generate all asset categories and track totals
-    print("\n" + "=" * 50)
-    print("WEB PWA ASSETS")
-    print("=" * 50)
-    web_icons = generate_web_icons(master_images["icon"]) or 0
-    web_logos = generate_web_logos(master_images["logo"]) or 0
-    web_logos_inverted = generate_web_logos_inverted(master_images["logo_inverted"]) or 0
-    total_images_generated += web_icons + web_logos + web_logos_inverted
+    # Nothing changed since the last successful run - only refresh the config files
+    if not args.dry_run and is_build_current(master_images, unchanged_masters, manifest):
+        print("\n✅ No changes detected; assets are up to date (use --force to regenerate)")
+        print_banner("CONFIGURATION FILES")
+        write_config_files()
+        return
     
-    print("\n" + "=" * 50)
-    print("iOS ASSETS")
-    print("=" * 50)
-    ios_icons = generate_ios_icons(master_images["icon"]) or 0
-    ios_logos = generate_ios_logos(master_images["logo"]) or 0
-    ios_logos_inverted = generate_ios_logos_inverted(master_images["logo_inverted"]) or 0
-    total_images_generated += ios_icons + ios_logos + ios_logos_inverted
+    # Collect resize jobs for all asset categories
+    print_banner("WEB PWA ASSETS")
+    asset_groups = [
+        ("Web PWA icons", generate_web_icons(master_images["icon"])),
+        ("Web logos and assets", generate_web_logos(master_images["logo"])),
+        ("Web inverted logos and assets", generate_web_logos_inverted(master_images["logo_inverted"])),
+    ]
     
-    print("\n" + "=" * 50)
-    print("ANDROID ASSETS")
-    print("=" * 50)
-    android_icons = generate_android_icons(master_images["icon"]) or 0
-    android_logos = generate_android_logos(master_images["logo"]) or 0
-    android_logos_inverted = generate_android_logos_inverted(master_images["logo_inverted"]) or 0
-    total_images_generated += android_icons + android_logos + android_logos_inverted
+    print_banner("iOS ASSETS")
+    asset_groups += [
+        ("iOS app icons", generate_ios_icons(master_images["icon"])),
+        ("iOS header logos", generate_ios_logos(master_images["logo"])),
+        ("iOS header inverted logos", generate_ios_logos_inverted(master_images["logo_inverted"])),
+    ]
     
-    print("\n" + "=" * 50)
-    print("SPLASH SCREENS")
-    print("=" * 50)
-    splash_total = generate_splash_screens() or 0
-    total_images_generated += splash_total
+    print_banner("ANDROID ASSETS")
+    asset_groups += [
+        ("Android app icons", generate_android_icons(master_images["icon"])),
+        ("Android header logos", generate_android_logos(master_images["logo"])),
+        ("Android header inverted logos", generate_android_logos_inverted(master_images["logo_inverted"])),
+    ]
     
-    print("\n" + "=" * 50)
-    print("TOTAL ASSETS DEPLOYED")
-    print("=" * 50)
+    print_banner("SPLASH SCREENS")
+    asset_groups += [
+        ("Splash screens", generate_splash_screens()),
+        ("Android 12+ splash icons", generate_android_splash_icons()),
+    ]
+    
+    all_jobs = [job for _, jobs in asset_groups for job in jobs]
+    if args.dry_run:
+        print_banner("RESIZE PLAN (dry run - nothing written)")
+        print_job_plan(all_jobs)
+        return
+    
+    # Create every output directory up front so workers can write straight away
+    create_output_directories()
+    
+    # Resize all collected jobs in a single process pool
+    print_banner("RESIZING IMAGES")
+    background_paths = generate_android_icon_backgrounds()
+    xml_paths = create_android_adaptive_icon_xmls()
+    total_images_generated += len(background_paths)
+    total_images_generated += len(xml_paths)
+    
+    # Write the config files while the workers resize - they don't depend on any
+    # image; their messages are printed in the CONFIGURATION FILES section
+    config_log = []
+    results = run_resize_jobs(all_jobs, force=force, backend=args.backend, unchanged_masters=unchanged_masters,
+                              changed_masters=changed_masters, while_resizing=lambda: write_config_files(config_log.append))
+    
+    # Record the masters once every image is in place, off the main thread
+    manifest_thread = None
+    if all(results) and len(background_paths) == len(ANDROID_ICON_SIZES):
+        output_paths = [job.out for job in all_jobs] + background_paths + xml_paths
+        manifest_thread = threading.Thread(target=save_asset_manifest, args=(master_records, args.backend, output_paths))
+        manifest_thread.start()
+    
+    print()
+    offset = 0
+    for label, jobs in asset_groups:
+        success_count = sum(results[offset:offset + len(jobs)])
+        offset += len(jobs)
+        print(f"✅ {label}: {success_count}/{len(jobs)} generated")
+        total_images_generated += success_count
+    
+    print_banner("TOTAL ASSETS DEPLOYED")
     print(f"✅ Total image assets placed in destination folders: {total_images_generated}")
     print("   (Includes generated, resized, and copied image files)")
     
-    print("\n" + "=" * 50)
-    print("CONFIGURATION FILES")
-    print("=" * 50)
-    create_ios_contents_json()
-    update_manifest_json()
-    print("✅ iOS Contents.json files created")
+    print_banner("CONFIGURATION FILES")
+    for message in config_log:
+        print(message)
     
-    print("\n" + "=" * 50)
-    print("GENERATION COMPLETE")
-    print("=" * 50)
+    if manifest_thread is not None:
+        manifest_thread.join()
+    
+    print_banner("GENERATION COMPLETE")
     print("✅ All image assets generated successfully")
     print("✅ Platform configurations updated")
     
-    print("\n" + "=" * 50)
-    print("NEXT STEPS")
-    print("=" * 50)
+    print_banner("NEXT STEPS")
     print("To deploy these assets to your mobile app:")
     print("1. Run: ./gipity-scripts/gipity-appflow-prepare.sh prod")
     print("   (or 'dev' for development builds)")